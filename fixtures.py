@@ -0,0 +1,45 @@
+"""Read-only event fixtures for test_kalshi.py.
+
+Each event is a MappingProxyType with its markets as a tuple of
+MappingProxyTypes, so a function under test cannot mutate a fixture
+that later tests rely on.
+"""
+
+from types import MappingProxyType
+
+
+def _freeze(event):
+    frozen = dict(event)
+    if "markets" in frozen:
+        frozen["markets"] = tuple(MappingProxyType(m) for m in frozen["markets"])
+    return MappingProxyType(frozen)
+
+
+# Binary market
+BINARY_EVENT = _freeze({
+    "title": "Will it rain tomorrow?",
+    "mutually_exclusive": False,
+    "markets": [
+        {"ticker": "RAIN-YES", "last_price": 65}
+    ],
+})
+
+# Multi-outcome market
+MULTI_EVENT = _freeze({
+    "title": "Fed decision in March?",
+    "mutually_exclusive": True,
+    "markets": [
+        {"ticker": "KXFED-HOLD", "yes_sub_title": "Hold", "last_price": 83},
+        {"ticker": "KXFED-CUT25", "yes_sub_title": "Cut 25bps", "last_price": 12},
+        {"ticker": "KXFED-CUT50", "yes_sub_title": "Cut 50bps", "last_price": 3},
+    ],
+})
+
+# Empty markets
+EMPTY_EVENT = _freeze({"title": "Empty", "markets": []})
+
+BROWSE_EVENTS = (
+    _freeze({"title": "Event A", "event_ticker": "EVA", "series_ticker": "EVA"}),
+    _freeze({"title": "Event B", "event_ticker": "EVB", "series_ticker": "EVB"}),
+    _freeze({"title": "Event C", "event_ticker": "EVC", "series_ticker": "EVC"}),
+)
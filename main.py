@@ -9,6 +9,11 @@ import json
 import sys
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the skill root to sys.path so we can import the API client
 _skill_root = os.path.abspath(os.path.dirname(__file__))
 if _skill_root not in sys.path:
@@ -53,35 +58,65 @@ def market(url: str) -> dict:
     event_ticker = parsed.get("event_ticker")
 
     if not event_ticker:
-        return {
-            "title": None,
-            "outcomes": [],
-            "status": "error",
-            "error": f"Could not extract event ticker from URL: {url}",
-        }
+        return _error_result(f"Could not extract event ticker from URL: {url}")
 
     try:
         event = fetch_event(event_ticker)
         return event_to_market_result(event)
     except KalshiAPIError as exc:
-        return {
-            "title": None,
-            "outcomes": [],
-            "status": "error",
-            "error": str(exc),
-        }
+        return _error_result(str(exc))
+
+
+def browse_markets(url: str = "https://kalshi.com", max_markets: int = 20) -> list[dict]:
+    """Like browse(), but return full market() data for each listed event.
+
+    The listing carries each event's nested markets, so this is a single
+    request with no per-event lookups.
+
+    Args:
+        url: Kalshi page URL or category URL.
+        max_markets: Maximum number of markets to return.
+
+    Returns:
+        List of dicts with 'title', 'outcomes', 'status', and 'error' keys.
+    """
+    parsed = parse_kalshi_url(url)
+    category_slug = parsed.get("category_slug")
+    events = fetch_events(category_slug=category_slug, limit=max_markets, with_markets=True)
+    return [event_to_market_result(event) for event in events]
+
+
+def _error_result(message):
+    return {
+        "title": None,
+        "outcomes": [],
+        "status": "error",
+        "error": message,
+    }
+
+
+def _print_json(obj):
+    """Print obj as indented JSON, serializing with orjson when available."""
+    out = getattr(sys.stdout, "buffer", None)
+    if orjson is None or out is None:
+        print(json.dumps(obj, indent=2, ensure_ascii=False))
+        return
+    sys.stdout.flush()
+    out.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    out.flush()
 
 
 # Allow direct execution: python main.py browse|market [args]
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python main.py browse [--url URL] [--max N]")
+        print("       python main.py browse-markets [--url URL] [--max N]")
         print("       python main.py market <URL>")
         sys.exit(1)
 
     command = sys.argv[1]
 
-    if command == "browse":
+    if command in ("browse", "browse-markets"):
         url = "https://kalshi.com"
         max_m = 20
         args = sys.argv[2:]
@@ -95,13 +130,14 @@ if __name__ == "__main__":
                 i += 2
             else:
                 i += 1
-        print(json.dumps(browse(url=url, max_markets=max_m), indent=2, ensure_ascii=False))
+        fn = browse if command == "browse" else browse_markets
+        _print_json(fn(url=url, max_markets=max_m))
 
     elif command == "market":
         if len(sys.argv) < 3:
             print("Usage: python main.py market <URL>", file=sys.stderr)
             sys.exit(1)
-        print(json.dumps(market(url=sys.argv[2]), indent=2, ensure_ascii=False))
+        _print_json(market(url=sys.argv[2]))
 
     else:
         print(f"Unknown command: {command}", file=sys.stderr)
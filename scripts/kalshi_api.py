@@ -1,18 +1,102 @@
 """Kalshi public REST API client.
 
-Lightweight client using only Python stdlib (urllib.request + json).
+Lightweight client using only Python stdlib (http.client + json).
+Honours https_proxy / no_proxy like urllib does.
 Replaces the Selenium-based scraper with direct API calls to
 https://api.elections.kalshi.com/trade-api/v2.
+
+If orjson or pysimdjson is installed it is used to parse responses;
+neither is required.
 """
 
+import base64
+import gzip
+import http.client
+import itertools
 import json
+import os
 import re
-import urllib.request
+import sqlite3
+import threading
+import time
 import urllib.error
 import urllib.parse
+import urllib.request
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 KALSHI_WEB = "https://kalshi.com"
+_MARKET_URL_PREFIX = KALSHI_WEB + "/markets/"
+
+_API_HOST = urllib.parse.urlsplit(BASE_URL).netloc
+_API_PATH = urllib.parse.urlsplit(BASE_URL).path
+_USER_AGENT = "kalshi-market-data/2.0.0"
+_TIMEOUT = 30
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# Idle keep-alive connections to _API_HOST, reused across requests
+# (sized to match the fetch_events_by_tickers worker count)
+_POOL_MAXSIZE = 8
+_idle_connections = []
+_pool_lock = threading.Lock()
+
+# Response cache: per-endpoint freshness TTLs (seconds). Entries up to
+# _CACHE_MAX_AGE old are kept as a fallback for when the API is down.
+# Set KALSHI_NO_CACHE=1 (or _CACHE_ENABLED = False) to always hit the API.
+_CACHE_ENABLED = not os.environ.get("KALSHI_NO_CACHE")
+_EVENTS_TTL = 30
+_EVENT_TTL = 10
+_CACHE_MAX_AGE = 24 * 60 * 60
+_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "openkalsh",
+    "resp.sqlite",
+)
+# In-process LRU of (timestamp, body), capped so a long-lived process
+# does not keep every ticker and cursor page it has ever fetched
+_MEMORY_CACHE_MAXSIZE = 128
+_memory_cache = OrderedDict()
+_disk_cache = None  # sqlite3 connection; False once it has proved unusable
+# _cache_lock guards only the in-memory LRU; the (slower) sqlite reads and
+# commits take _disk_cache_lock, so memory hits never wait on the disk
+_cache_lock = threading.Lock()
+_disk_cache_lock = threading.Lock()
+
+# Kalshi web paths (leading/trailing "/" stripped):
+#   category/<slug>[/...] or sports/<slug>[/...]  → group 1: category slug
+#   markets/<series>[/<slug>]/<event_ticker>      → group 2: last segment
+_URL_PATH_RE = re.compile(
+    r"(?:category|sports)/([^/]*)|markets/(?:.*/)?([^/]*)\Z", re.DOTALL
+)
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_DASH_RUN_RE = re.compile(rb"-+")
+# bytes.translate table: keeps [0-9a-z], lowercases [A-Z], maps every
+# other byte to "-"
+_SLUG_TRANS = bytes(
+    c if 48 <= c <= 57 or 97 <= c <= 122 else c + 32 if 65 <= c <= 90 else 45
+    for c in range(256)
+)
+
+# simdjson's per-document setup cost outweighs its scan speed on small bodies
+_SIMDJSON_MIN_BYTES = 16 * 1024
+
+# Category browses are filtered client-side: page through at most this
+# many /events pages of this size looking for matches.
+_CATEGORY_PAGE_SIZE = 200
+_CATEGORY_MAX_PAGES = 5
 
 # Map URL slugs to API category names where they differ
 _SLUG_TO_CATEGORY = {
@@ -37,33 +121,140 @@ class KalshiAPIError(Exception):
 # HTTP helper
 # ---------------------------------------------------------------------------
 
-def _api_get(path, params=None):
+def _api_get(path, params=None, ttl=0):
     """HTTP GET against the Kalshi API, returns parsed JSON.
 
     Args:
         path: API path (e.g. "/events").
         params: Optional dict of query parameters.
+        ttl: Seconds a cached response stays fresh; 0 disables caching.
 
     Returns:
-        Parsed JSON response as dict/list.
+        Parsed JSON response as dict/list. A dict served from a stale
+        cache entry (because the API call failed) has "_stale" set.
 
     Raises:
         KalshiAPIError: On HTTP or JSON errors.
     """
-    url = BASE_URL + path
+    data, stale = _cached_api_get(path, params, ttl, _loads)
+    if stale and isinstance(data, dict):
+        data["_stale"] = True
+    return data
+
+
+def _cached_api_get(path, params, ttl, parse):
+    """Fetch `path` through the response cache and return (parse(body), stale).
+
+    A fresh cache entry is returned without touching the network. When
+    the request fails with a network or 5xx error, a stale entry is
+    returned instead (stale=True) if one exists. Only bodies that
+    `parse` accepts are cached.
+    """
+    if not _CACHE_ENABLED:
+        ttl = 0
+    key = _cache_key(path, params)
+    entry = _cache_get(key) if ttl else None
+    if entry is not None and time.time() - entry[0] < ttl:
+        return parse(entry[1]), False
+
+    try:
+        body = _api_get_raw(path, params)
+    except KalshiAPIError as exc:
+        if entry is not None and (exc.status_code is None or exc.status_code >= 500):
+            return parse(entry[1]), True
+        raise
+
+    try:
+        data = parse(body)
+    except ValueError as exc:
+        # json/orjson decode errors and simdjson parse errors are all ValueError
+        raise KalshiAPIError(f"Invalid JSON from {path}: {exc}") from exc
+    if ttl:
+        _cache_put(key, body)
+    return data, False
+
+
+def _api_get_raw(path, params=None):
+    """HTTP GET against the Kalshi API, returns the undecoded response body.
+
+    Connections are kept alive and reused across calls, so only the first
+    request pays for the TCP + TLS handshake.
+
+    Raises:
+        KalshiAPIError: On HTTP or network errors.
+    """
+    url = _API_PATH + path
     if params:
         qs = urllib.parse.urlencode(
             {k: v for k, v in params.items() if v is not None}
         )
         url = f"{url}?{qs}"
 
-    req = urllib.request.Request(url)
-    req.add_header("Accept", "application/json")
+    conn, reused = _acquire_connection()
+    try:
+        try:
+            resp = _send_get(conn, url)
+        except ConnectionError:
+            # The server may have dropped an idle keep-alive connection;
+            # retry once on a fresh one.
+            conn.close()
+            if not reused:
+                raise
+            conn = _new_connection()
+            resp = _send_get(conn, url)
+        body = resp.read()
+    except (OSError, http.client.HTTPException) as exc:
+        conn.close()
+        raise KalshiAPIError(f"Network error calling {path}: {exc}") from exc
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _release_connection(conn)
+
+    if resp.getheader("Content-Encoding", "").lower() == "gzip":
+        try:
+            body = gzip.decompress(body)
+        except (OSError, EOFError, zlib.error) as exc:
+            raise KalshiAPIError(
+                f"Invalid gzip body from {path}: {exc}", status_code=resp.status
+            ) from exc
+
+    if resp.status in _REDIRECT_STATUSES and resp.getheader("Location"):
+        # Rare; hand off to urllib, which follows redirects across hosts
+        location = urllib.parse.urljoin(
+            f"https://{_API_HOST}{url}", resp.getheader("Location")
+        )
+        return _urlopen_get(location, path)
 
+    if resp.status >= 400:
+        msg = f"Kalshi API returned HTTP {resp.status} for {path}"
+        detail = body.decode("utf-8", errors="replace")
+        if detail:
+            msg += f": {detail[:200]}"
+        raise KalshiAPIError(msg, status_code=resp.status)
+    return body
+
+
+def _send_get(conn, url):
+    conn.request("GET", url, headers={
+        "Accept": "application/json",
+        # Event listings are large, repetitive JSON and compress very well
+        "Accept-Encoding": "gzip",
+        "User-Agent": _USER_AGENT,
+    })
+    return conn.getresponse()
+
+
+def _urlopen_get(url, path):
+    """One-off GET of an absolute URL via urllib (redirects, proxies)."""
+    req = urllib.request.Request(url, headers={
+        "Accept": "application/json",
+        "User-Agent": _USER_AGENT,
+    })
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            body = resp.read().decode("utf-8")
-            return json.loads(body)
+        with urllib.request.urlopen(req, timeout=_TIMEOUT) as resp:
+            return resp.read()
     except urllib.error.HTTPError as exc:
         msg = f"Kalshi API returned HTTP {exc.code} for {path}"
         try:
@@ -72,10 +263,189 @@ def _api_get(path, params=None):
         except Exception:
             pass
         raise KalshiAPIError(msg, status_code=exc.code) from exc
-    except urllib.error.URLError as exc:
+    except (OSError, http.client.HTTPException) as exc:
         raise KalshiAPIError(f"Network error calling {path}: {exc}") from exc
-    except json.JSONDecodeError as exc:
-        raise KalshiAPIError(f"Invalid JSON from {path}: {exc}") from exc
+
+
+def _new_connection():
+    """Open a connection to _API_HOST, tunnelling through HTTPS_PROXY if set."""
+    proxy = _https_proxy()
+    if proxy is None:
+        return http.client.HTTPSConnection(_API_HOST, timeout=_TIMEOUT)
+    host, port, headers = proxy
+    conn = http.client.HTTPSConnection(host, port, timeout=_TIMEOUT)
+    conn.set_tunnel(_API_HOST, headers=headers)
+    return conn
+
+
+def _https_proxy():
+    """Return (host, port, headers) of the proxy for _API_HOST, or None.
+
+    Honours the same https_proxy / no_proxy settings as urllib.
+    """
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(_API_HOST):
+        return None
+    parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    headers = {}
+    if parts.username:
+        creds = urllib.parse.unquote(parts.username)
+        creds += ":" + urllib.parse.unquote(parts.password or "")
+        headers["Proxy-Authorization"] = (
+            "Basic " + base64.b64encode(creds.encode()).decode("ascii")
+        )
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return parts.hostname, port, headers
+
+
+def _acquire_connection():
+    """Return (connection, reused) — an idle pooled connection if any."""
+    with _pool_lock:
+        if _idle_connections:
+            return _idle_connections.pop(), True
+    return _new_connection(), False
+
+
+def _release_connection(conn):
+    """Return a connection to the idle pool, closing it if the pool is full."""
+    with _pool_lock:
+        if len(_idle_connections) < _POOL_MAXSIZE:
+            _idle_connections.append(conn)
+            return
+    conn.close()
+
+
+def _cache_key(path, params):
+    """Cache key for a request: path plus its sorted, non-None query params."""
+    if not params:
+        return path
+    items = sorted((k, v) for k, v in params.items() if v is not None)
+    return f"{path}?{urllib.parse.urlencode(items)}"
+
+
+def _cache_db():
+    """Return the on-disk cache connection, or None if it is unavailable.
+
+    The caller must hold _disk_cache_lock.
+    """
+    global _disk_cache
+    if _disk_cache is None:
+        try:
+            os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+            db = sqlite3.connect(_CACHE_PATH, timeout=1, check_same_thread=False)
+            # WAL with synchronous=NORMAL: a commit appends to the log
+            # instead of fsyncing the database file every time
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            with db:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses"
+                    " (key TEXT PRIMARY KEY, ts REAL, body BLOB)"
+                )
+                db.execute(
+                    "DELETE FROM responses WHERE ts < ?",
+                    (time.time() - _CACHE_MAX_AGE,),
+                )
+            _disk_cache = db
+        except (OSError, sqlite3.Error):
+            _disk_cache = False
+    return _disk_cache or None
+
+
+def _cache_get(key):
+    """Return the cached (timestamp, body) for `key`, or None."""
+    with _cache_lock:
+        entry = _memory_cache.get(key)
+    if entry is None:
+        row = None
+        with _disk_cache_lock:
+            db = _cache_db()
+            if db is not None:
+                try:
+                    row = db.execute(
+                        "SELECT ts, body FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error:
+                    pass
+        if row is None:
+            return None
+        entry = (row[0], bytes(row[1]))
+    with _cache_lock:
+        current = _memory_cache.get(key)
+        if current is not None and current[0] > entry[0]:
+            entry = current  # a newer response was stored meanwhile
+        if time.time() - entry[0] > _CACHE_MAX_AGE:
+            _memory_cache.pop(key, None)
+            return None
+        _memory_cache_store(key, entry)
+    return entry
+
+
+def _memory_cache_store(key, entry):
+    """Insert into the in-process LRU, evicting the least recently used.
+
+    The caller must hold _cache_lock.
+    """
+    _memory_cache[key] = entry
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > _MEMORY_CACHE_MAXSIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _cache_put(key, body):
+    """Store a response body in the in-process and on-disk caches."""
+    entry = (time.time(), body)
+    with _cache_lock:
+        _memory_cache_store(key, entry)
+    with _disk_cache_lock:
+        db = _cache_db()
+        if db is not None:
+            try:
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                        (key, entry[0], entry[1]),
+                    )
+            except sqlite3.Error:
+                pass
+
+
+def warm_connections(count=1):
+    """Open up to `count` keep-alive API connections ahead of time.
+
+    The TCP + TLS handshakes run concurrently and the connections are
+    added to the idle pool, so the next requests (e.g. the workers of
+    fetch_events_by_tickers) start on an already-negotiated connection.
+    Connection failures are ignored; the request itself reports them.
+
+    Returns:
+        Number of connections added to the pool.
+    """
+    count = min(count, _POOL_MAXSIZE)
+    if count <= 0:
+        return 0
+
+    def connect(_):
+        conn = _new_connection()
+        try:
+            conn.connect()
+        except OSError:
+            conn.close()
+            return False
+        _release_connection(conn)
+        return True
+
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return sum(pool.map(connect, range(count)))
+
+
+def _loads(body):
+    """Parse a JSON response body (bytes) with the fastest available parser."""
+    if orjson is not None:
+        return orjson.loads(body)
+    if simdjson is not None and len(body) > _SIMDJSON_MIN_BYTES:
+        return simdjson.Parser().parse(body, recursive=True)
+    return json.loads(body.decode("utf-8"))
 
 
 # ---------------------------------------------------------------------------
@@ -105,71 +475,92 @@ def parse_kalshi_url(url):
     if not path:
         return {"type": "home"}
 
-    segments = path.split("/")
-
-    # /category/<slug>
-    if segments[0] == "category" and len(segments) >= 2:
-        return {"type": "category", "category_slug": segments[1]}
-
-    # /sports/<slug>
-    if segments[0] == "sports" and len(segments) >= 2:
-        return {"type": "category", "category_slug": segments[1]}
-
-    # /markets/<series_ticker>/<slug>/<event_ticker>
-    # or /markets/<series_ticker>/<slug>
-    if segments[0] == "markets" and len(segments) >= 3:
-        # The event ticker is the last segment that looks like a ticker
-        # (contains letters and possibly hyphens/numbers)
-        event_ticker = segments[-1].upper()
-        return {"type": "market", "event_ticker": event_ticker}
-
-    # /markets/<something> with only 2 segments
-    if segments[0] == "markets" and len(segments) == 2:
-        return {"type": "market", "event_ticker": segments[1].upper()}
+    m = _URL_PATH_RE.match(path)
+    if m is None:
+        return {"type": "home"}
 
-    return {"type": "home"}
+    category_slug, event_ticker = m.groups()
+    if category_slug is not None:
+        return {"type": "category", "category_slug": category_slug}
+    return {"type": "market", "event_ticker": event_ticker.upper()}
 
 
 # ---------------------------------------------------------------------------
 # API data fetching
 # ---------------------------------------------------------------------------
 
-def fetch_events(category_slug=None, status="open", limit=20):
+def fetch_events(category_slug=None, status="open", limit=20, with_markets=False):
     """Fetch events from the Kalshi API.
 
     Args:
         category_slug: Optional category to filter by (client-side).
         status: Event status filter (default "open").
         limit: Maximum number of events to return.
+        with_markets: Also return each event's nested "markets" list.
+            Off by default: it makes the response several times larger
+            and browse() does not use it. browse_markets() sets it and
+            reads outcomes straight from the listing.
 
     Returns:
         List of event dicts from the API.
     """
+    # A negative limit (e.g. --max -1) would make islice() raise
+    limit = max(limit, 0)
+    if not limit:
+        return []
+
     # When filtering by category client-side, request more from the API
     # since matching events may be sparse across all categories.
-    api_limit = max(limit, 200) if category_slug else limit
+    api_limit = max(limit, _CATEGORY_PAGE_SIZE) if category_slug else limit
 
     params = {
-        "with_nested_markets": "true",
+        "with_nested_markets": "true" if with_markets else None,
         "status": status,
         "limit": str(api_limit),
     }
 
-    data = _api_get("/events", params)
-    events = data.get("events", [])
-
     if category_slug:
         # Resolve slug to API category name if needed
         category_name = _SLUG_TO_CATEGORY.get(category_slug.lower(), category_slug)
-        cat_lower = category_name.lower()
-        events = [
-            e for e in events
-            if e.get("category", "").lower() == cat_lower
-        ]
+        matches = _category_matcher(category_name)
+
+        # Follow the cursor until enough matching events are found. Each
+        # cursor comes from the previous page, so pages are fetched in turn.
+        events = []
+        cursor = None
+        for _ in range(_CATEGORY_MAX_PAGES):
+            page, cursor = _fetch_category_page(
+                dict(params, cursor=cursor), matches, limit - len(events)
+            )
+            events.extend(page)
+            if len(events) >= limit or not cursor:
+                break
+    else:
+        data = _api_get("/events", params, ttl=_EVENTS_TTL)
+        events = data.get("events", [])
 
     return events[:limit]
 
 
+def _fetch_category_page(params, matches, limit):
+    """Fetch one /events page; return (up to `limit` matching events, next cursor)."""
+    if simdjson is not None:
+        # Most of the over-fetched events are dropped by the filter, so
+        # only materialize the ones that survive it.
+        return _cached_api_get(
+            "/events", params, _EVENTS_TTL,
+            lambda body: _select_events_lazy(body, matches, limit),
+        )[0]
+
+    data = _api_get("/events", params, ttl=_EVENTS_TTL)
+    # Stop scanning as soon as `limit` matches are found
+    events = list(itertools.islice(
+        (e for e in data.get("events", []) if matches(e.get("category"))),
+        limit,
+    ))
+    return events, data.get("cursor") or None
+
+
 def fetch_event(event_ticker):
     """Fetch a single event by ticker.
 
@@ -177,14 +568,54 @@ def fetch_event(event_ticker):
         event_ticker: The event ticker (e.g. "KXFED-26MAR").
 
     Returns:
-        Event dict from the API.
+        Event dict from the API. If the API could not be reached and a
+        cached copy was used instead, the dict has "_stale" set.
 
     Raises:
         KalshiAPIError: If the event is not found or API fails.
     """
     ticker_encoded = urllib.parse.quote(event_ticker, safe="")
-    data = _api_get(f"/events/{ticker_encoded}", {"with_nested_markets": "true"})
-    return data.get("event", data)
+    data = _api_get(
+        f"/events/{ticker_encoded}", {"with_nested_markets": "true"}, ttl=_EVENT_TTL
+    )
+    event = data.get("event", data)
+    if data.get("_stale"):
+        event["_stale"] = True
+    return event
+
+
+def fetch_events_by_tickers(event_tickers, max_workers=8, return_exceptions=False):
+    """Fetch several events concurrently.
+
+    Each lookup is a separate /events/{ticker} request; they run on a
+    thread pool and share the keep-alive connection pool.
+
+    Args:
+        event_tickers: Iterable of event tickers.
+        max_workers: Maximum number of requests in flight.
+        return_exceptions: If true, a failed lookup yields its
+            KalshiAPIError in place of the event instead of raising.
+
+    Returns:
+        List of event dicts, in the same order as event_tickers.
+
+    Raises:
+        KalshiAPIError: If a lookup fails and return_exceptions is false.
+    """
+    tickers = list(event_tickers)
+    if not tickers:
+        return []
+
+    def fetch(ticker):
+        try:
+            return fetch_event(ticker)
+        except KalshiAPIError as exc:
+            if return_exceptions:
+                return exc
+            raise
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as pool:
+        return list(pool.map(fetch, tickers))
 
 
 # ---------------------------------------------------------------------------
@@ -202,18 +633,20 @@ def events_to_browse_list(events, max_markets=20):
         List of {"title": str, "url": str} dicts.
     """
     results = []
+    prefix = _MARKET_URL_PREFIX
     for event in events:
-        title = event.get("title", "")
-        ticker = event.get("event_ticker", "")
-        series_ticker = event.get("series_ticker", "")
-
-        if not title or not ticker:
+        ticker = event.get("event_ticker")
+        if not ticker:
+            continue
+        title = event.get("title")
+        if not title:
             continue
+        series_ticker = event.get("series_ticker", "")
 
         # Build Kalshi web URL:  /markets/<series>/<slug>/<ticker>
         # Use series ticker (lowercase) and event ticker (lowercase) for the URL
         slug = _ticker_to_slug(title)
-        url = f"{KALSHI_WEB}/markets/{series_ticker.lower()}/{slug}/{ticker.lower()}"
+        url = f"{prefix}{series_ticker.lower()}/{slug}/{ticker.lower()}"
 
         results.append({"title": title, "url": url})
 
@@ -230,7 +663,8 @@ def event_to_market_result(event):
         event: Event dict from the API (with nested markets).
 
     Returns:
-        Dict with "title", "outcomes", "status", "error" keys.
+        Dict with "title", "outcomes", "status", "error" keys. Status is
+        "stale" when the outcomes come from a cached copy of the event.
     """
     result = {
         "title": event.get("title"),
@@ -276,7 +710,13 @@ def event_to_market_result(event):
                     "raw": f"{price}%",
                 })
 
-    result["status"] = "ok" if result["outcomes"] else "no_outcomes_found"
+    if not result["outcomes"]:
+        result["status"] = "no_outcomes_found"
+    elif event.get("_stale"):
+        # Served from cache because the API call failed
+        result["status"] = "stale"
+    else:
+        result["status"] = "ok"
     return result
 
 
@@ -301,9 +741,50 @@ def _market_price_cents(market):
     return None
 
 
+def _category_matcher(category_name):
+    """Return a predicate: does an event's `category` equal category_name?
+
+    The comparison is case-insensitive. The API uses only a handful of
+    distinct category strings, so each answer is memoized and most
+    events cost one dict lookup instead of a str.lower() call.
+    """
+    cat_lower = category_name.lower()
+    seen = dict.fromkeys((category_name, cat_lower, category_name.title()), True)
+
+    def matches(category):
+        hit = seen.get(category)
+        if hit is None:
+            hit = seen[category] = (category or "").lower() == cat_lower
+        return hit
+
+    return matches
+
+
+def _select_events_lazy(body, matches, limit):
+    """Pick up to `limit` events whose category `matches` from a raw /events body.
+
+    Walks the simdjson document on demand: only the `category` key is read
+    for each event, and just the matching events are converted to dicts.
+
+    Returns:
+        (events, next page cursor or None)
+    """
+    doc = simdjson.Parser().parse(body)
+    events = []
+    for e in doc.get("events") or ():
+        if matches(e.get("category")):
+            events.append(e.as_dict())
+            if len(events) >= limit:
+                break
+    return events, doc.get("cursor") or None
+
+
 def _ticker_to_slug(title):
     """Convert a title string to a URL-friendly slug."""
-    slug = title.lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
+    if title.isascii():
+        # Common case: lowercasing and replacement in one bytes.translate pass
+        slug = _DASH_RUN_RE.sub(b"-", title.encode("ascii").translate(_SLUG_TRANS))
+        return slug.strip(b"-")[:60].decode("ascii")
+    slug = _SLUG_RE.sub("-", title.lower())
     slug = slug.strip("-")
     return slug[:60]